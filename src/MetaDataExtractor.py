@@ -1,6 +1,155 @@
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
 import pdfplumber
 
+try:
+    # google-re2 provides a linear-time engine for the bulk full-document
+    # scans; everything keeps working on stdlib re when it is not installed
+    import re2 as _re_fast
+except ImportError:
+    _re_fast = re
+
+try:
+    # pdfminer's high-level text extraction skips pdfplumber's per-page
+    # object layer and is noticeably lighter for text-only passes
+    from pdfminer.high_level import extract_text as _pdfminer_extract_text
+except ImportError:
+    _pdfminer_extract_text = None
+
+try:
+    # pyahocorasick locates all section delimiters in one linear scan
+    import ahocorasick as _ahocorasick
+except ImportError:
+    _ahocorasick = None
+
+
+def _compile_fast(pattern: str, flags=0) -> re.Pattern:
+    """Compile a pattern with re2 when available, else with stdlib re.
+
+    Args:
+        pattern (str): regex pattern (must stay within re2's feature set)
+        flags: regex flags
+
+    Returns:
+        re.Pattern: compiled pattern
+    """
+    if _re_fast is not re:
+        try:
+            return _re_fast.compile(pattern, flags)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
+
+
+def _is_word_boundary(text: str, index: int) -> bool:
+    """True when position `index` does not continue a word in `text`.
+
+    Args:
+        text (str): text the keyword was found in
+        index (int): position directly after the keyword hit
+
+    Returns:
+        bool: True at the end of the text or before a non-word character
+    """
+    if index >= len(text):
+        return True
+    char = text[index]
+    return not (char.isalnum() or char == "_")
+
+
+def _find_word(lower: str, keyword: str, start: int = 0) -> int:
+    """Find a lowercased keyword hit that does not continue into a word.
+
+    Keeps the old patterns' `keyword\\b` semantics on top of str.find, so
+    e.g. 'AUSSCHREIBUNG' never matches inside 'Ausschreibungsunterlagen'.
+
+    Args:
+        lower (str): lowercased text to scan
+        keyword (str): lowercased literal keyword
+        start (int): offset to start scanning from
+
+    Returns:
+        int: start offset of the first boundary-respecting hit, or -1
+    """
+    idx = lower.find(keyword, start)
+    while idx >= 0:
+        if _is_word_boundary(lower, idx + len(keyword)):
+            return idx
+        idx = lower.find(keyword, idx + 1)
+    return -1
+
+
+# Precompiled patterns shared by all extractor instances
+_WS_RE = re.compile(r"\s+")
+_ORT_STRIP_RE = re.compile(r"(Tel\.?:.*|Fax\.?:.*|E-?mail:.*)", re.IGNORECASE)
+_TEL_RE = re.compile(r"Tel\.?:\s*([+\d\s/()-]+)")
+_FAX_RE = re.compile(r"Fax\.?:\s*([+\d\s/()-]+)")
+_EMAIL_RE = re.compile(r"([\w\.-]+@[\w\.-]+)")
+# Anchored to the segment end: only a date directly before 'LV:' (or the
+# end of the header) is the header date, not one inside the project name
+_TRAILING_DATE_RE = re.compile(r"(\d{1,2}[./-]\d{1,2}[./-]\d{2,4})\s*$")
+_LV_INFO_RE = re.compile(r"LV\s*:\s*(.*?)\s*(?:Seite\b|$)", re.IGNORECASE)
+_LV_SEITE_RE = re.compile(r"^(.*?)\s+Seite:")
+# 'Seite' plus digits and the table header line
+_POST_HEADER_CLEAN_PARTS = (
+    r"Seite:\s*\d+",
+    r"Position\s+Menge/Einheit\s+EP\s*\([A-Z]{3}\)\s+GP\s*\([A-Z]{3}\)",
+)
+
+
+@lru_cache(maxsize=8)
+def _post_header_clean_pattern(header_text: str) -> re.Pattern:
+    """Compile (and cache) the single-pass section cleanup pattern.
+
+    The header changes per PDF, so the combined alternation is cached per
+    header text rather than compiled on every call.
+
+    Args:
+        header_text (str): full header text to remove (may be empty)
+
+    Returns:
+        re.Pattern: alternation removing header, Seite marker and table header
+    """
+    parts = ()
+    if header_text:
+        # Match the whole header with flexible whitespace between its
+        # tokens, so reflowed copies still match. No free-form gap here:
+        # the company name alone also leaks into body text, and a prefix
+        # anchor would swallow legitimate text up to the next 'Seite: N'.
+        parts = (r"\s+".join(re.escape(token) for token in header_text.split()),)
+    return _compile_fast("|".join(parts + _POST_HEADER_CLEAN_PARTS), re.IGNORECASE)
+_HEADER_SPLIT_RE = re.compile(r"\s*--\s*")
+
+# First-page field labels and the metadata keys they map to. All labels are
+# anchored "Label : value" lines, so a single alternation regex can replace
+# the per-line loop over the individual patterns.
+_FIELD_LABEL_TO_KEY = {
+    "Projekt": "Projekt_Name_ErsteSeite",
+    "Bauherr": "Bauherr",
+    "Bauantragsplanung": "Bauantragsplanung",
+    "Ausführungsplanung": "Ausführungsplanung",
+    "Bauleitung": "Bauleitung",
+    "Ausführungszeitraum": "Ausführungszeitraum",
+    "Ausführungsbeginn": "Ausführungsbeginn",
+    "Angebotssumme Netto": "Angebotssumme Netto",
+    "Mehrwertsteuer (19 %)": "Mehrwertsteuer (19 %)",
+    "Angebotssumme Brutto": "Angebotssumme Brutto",
+    "Bieter": "Bieter",
+    "LV": "LV",
+}
+# One anchored alternation does the label dispatch in the regex engine.
+# The label itself stays a positional group: a named group per label would
+# not help here because m.lastgroup always reports the trailing value group.
+_FIELD_PREFIX_RE = re.compile(
+    r"^(" + "|".join(re.escape(label) for label in _FIELD_LABEL_TO_KEY) + r")\s*:\s*(?P<value>.*)"
+)
+
+
+
+
 class LVMetadataExtractor:
     """
     Extracts metadata from Leistungsverzeichnis (LV) PDFs such as
@@ -14,6 +163,9 @@ class LVMetadataExtractor:
         self.headers_first_meta = {}
         self.vorbemerkung = ""
         self.schlussbestimmung = ""
+        self._pdf = None
+        self._page_texts = {}
+        self._header_cache = {}
 
         # Define regex patterns for the first-page metadata
         self.patterns = {
@@ -40,15 +192,54 @@ class LVMetadataExtractor:
     def main(self) -> tuple:
         """main function to execute extraction steps
 
+        The PDF is opened only once and shared by all extraction steps,
+        instead of each step re-parsing the file on its own.
+
         Returns:
             tuple : tuple of dictionaries containing all extracted meta data
         """
-        first_page_meta = self.extract_first_page_metadata()
-        header_page_1 = self.extract_first_header()
-        vor_schlussbemerkung = self.extract_vorbestimmung_and_schlussbestimmung(self.pdf_path)
-        combined_dict = self.combine_to_dict()
+        with pdfplumber.open(self.pdf_path) as pdf:
+            self._pdf = pdf
+            try:
+                first_page_meta = self.extract_first_page_metadata()
+                header_page_1 = self.extract_first_header()
+                vor_schlussbemerkung = self.extract_vorbestimmung_and_schlussbestimmung(self.pdf_path)
+                combined_dict = self.combine_to_dict()
+            finally:
+                self._pdf = None
+                self._page_texts.clear()
         return first_page_meta, header_page_1, combined_dict, vor_schlussbemerkung
 
+    def _open_pdf(self, pdf=None) -> tuple:
+        """Return an open pdfplumber PDF and whether this call owns it.
+
+        Args:
+            pdf: optional already-open pdfplumber PDF to reuse
+
+        Returns:
+            tuple: (pdf, owns_handle) - owns_handle is True if the caller
+            has to close the handle again
+        """
+        pdf = pdf or self._pdf
+        if pdf is not None:
+            return pdf, False
+        return pdfplumber.open(self.pdf_path), True
+
+    def _page_text(self, page) -> str:
+        """Extract the text of a page, cached per page number.
+
+        Args:
+            page: pdfplumber page object
+
+        Returns:
+            str: extracted page text (empty string if the page has none)
+        """
+        text = self._page_texts.get(page.page_number)
+        if text is None:
+            text = page.extract_text() or ""
+            self._page_texts[page.page_number] = text
+        return text
+
     def extract_header_metadata(self, page:int) -> dict:
         """Extract structured header info (Company, Street, Ort, Tel, Fax, E-mail, Projekt, Datum, LV)
         from a given pdfplumber page object.
@@ -59,6 +250,10 @@ class LVMetadataExtractor:
         Returns:
             dict: dictionary containing the header of a respecitve page
         """
+        cached = self._header_cache.get(page.page_number)
+        if cached is not None:
+            return dict(cached)
+
         header_data = {}
         try:
             head_line = self._extract_header_text(page)
@@ -74,10 +269,16 @@ class LVMetadataExtractor:
         except Exception as e:
             print(f"Header extraction failed on page {getattr(page, 'page_number', '?')}: {e}")
 
+        # Cache a copy so callers can mutate the returned dict freely
+        self._header_cache[page.page_number] = dict(header_data)
         return header_data
 
     def _extract_header_text(self, page: int) -> str | None:
-        """Extract raw header text from table or top lines.
+        """Extract raw header text from top lines, falling back to tables.
+
+        Plain text extraction is far cheaper than pdfplumber's table
+        detection, so the table path is only taken when the top lines do
+        not look like a header.
 
         Args:
             page (int): respective page of pdf
@@ -85,12 +286,17 @@ class LVMetadataExtractor:
         Returns:
             : _description_
         """
-        tables = page.extract_tables()
+        text = self._page_text(page)
+        head = "\n".join(text.split("\n")[:6]) if text else ""
+        if "--" in head or "Seite" in head:
+            return head
+
+        tables = page.extract_tables(
+            table_settings={"vertical_strategy": "text", "horizontal_strategy": "text"}
+        )
         if tables and tables[0] and tables[0][0]:
             return tables[0][0][0]
-        else:
-            text = page.extract_text()
-            return "\n".join(text.split("\n")[:6]) if text else ""
+        return head
 
     def _normalize_text(self, text: str) -> str:
         """Normalize whitespace and remove line breaks.
@@ -101,7 +307,8 @@ class LVMetadataExtractor:
         Returns:
             str: normalized string
         """
-        return " ".join(text.split()).strip()
+        # Single regex pass; avoids materializing the token list of split()
+        return _WS_RE.sub(" ", text).strip()
 
     def _split_header_parts(self, text: str) -> list:
         """Split header sections separated by '--'.
@@ -112,7 +319,9 @@ class LVMetadataExtractor:
         Returns:
             list: list containing the separatations
         """
-        return [p.strip() for p in re.split(r"\s*--\s*", text) if p.strip()]
+        # map avoids stripping each part twice (once for the filter, once
+        # for the result)
+        return [p for p in map(str.strip, _HEADER_SPLIT_RE.split(text)) if p]
 
     def _extract_basic_info(self, parts: list) -> dict:
         """Extract company, street, and cleaned city (Ort).
@@ -129,9 +338,7 @@ class LVMetadataExtractor:
         if len(parts) >= 2:
             info["Straße"] = parts[1]
         if len(parts) >= 3:
-            ort_candidate = re.sub(
-                r"(Tel\.?:.*|Fax\.?:.*|E-?mail:.*)", "", parts[2], flags=re.IGNORECASE
-            ).strip()
+            ort_candidate = _ORT_STRIP_RE.sub("", parts[2]).strip()
             info["Ort"] = ort_candidate
         return info
 
@@ -146,15 +353,12 @@ class LVMetadataExtractor:
         """
         info = {}
         for part in parts:
-            lower = part.lower()
-            if "tel" in lower:
-                if m := re.search(r"Tel\.?:\s*([+\d\s/()-]+)", part):
-                    info["Tel"] = m.group(1).strip()
-            if "fax" in lower:
-                if m := re.search(r"Fax\.?:\s*([+\d\s/()-]+)", part):
-                    info["Fax"] = m.group(1).strip()
+            if m := _TEL_RE.search(part):
+                info["Tel"] = m.group(1).strip()
+            if m := _FAX_RE.search(part):
+                info["Fax"] = m.group(1).strip()
             if "@" in part:
-                if m := re.search(r"([\w\.-]+@[\w\.-]+)", part):
+                if m := _EMAIL_RE.search(part):
                     info["E-mail"] = m.group(1).strip()
         return info
 
@@ -168,14 +372,33 @@ class LVMetadataExtractor:
             dict: dictionary containing the name and optional date
         """
         info = {}
-        proj_match = re.search(
-            r"Projekt\s*:\s*(.+?)(?:\s+(\d{1,2}[./-]\d{1,2}[./-]\d{2,4}))?(?:\s+LV:|$)",
-            text,
-        )
-        if proj_match:
-            info["Projekt_Name_Kopfzeile"] = proj_match.group(1).strip()
-            if proj_match.group(2):
-                info["Datum"] = proj_match.group(2).strip()
+        # Anchor on the 'Projekt :' label and the following 'LV:' first;
+        # the date regex then only runs on the short slice in between
+        # instead of a lazy pattern with two optional tails. The label
+        # needs its ':' like the old pattern did - a bare 'Projekt' inside
+        # e.g. a company name is no anchor.
+        n = len(text)
+        start = text.find("Projekt")
+        while start >= 0:
+            pos = start + len("Projekt")
+            while pos < n and text[pos].isspace():
+                pos += 1
+            if pos < n and text[pos] == ":":
+                break
+            start = text.find("Projekt", start + 1)
+        if start < 0:
+            return info
+        tail_end = text.find("LV:", pos + 1)
+        segment = text[pos + 1:tail_end if tail_end > 0 else None].strip()
+        if not segment:
+            return info
+
+        date_match = _TRAILING_DATE_RE.search(segment)
+        if date_match:
+            info["Projekt_Name_Kopfzeile"] = segment[:date_match.start()].rstrip()
+            info["Datum"] = date_match.group(1)
+        else:
+            info["Projekt_Name_Kopfzeile"] = segment
         return info
 
     def _extract_lv_info(self, text: str) -> dict:
@@ -188,17 +411,18 @@ class LVMetadataExtractor:
             dict: dictioanry containing the LV value
         """
         info = {}
-        lv_match = re.search(r"LV\s*:\s*(.*?)\s*(?:Seite\b|$)", text, re.IGNORECASE)
+        lv_match = _LV_INFO_RE.search(text)
         if lv_match:
             info["LV"] = lv_match.group(1).strip()
         return info
 
 
-    def extract_header_from_page(self, page_number: int) -> dict:
+    def extract_header_from_page(self, page_number: int, pdf=None) -> dict:
         """Extract header info from a specific page number (1-indexed).
 
         Args:
             page_number (int): respective page of pdf
+            pdf: optional already-open pdfplumber PDF to reuse
 
         Raises:
             IndexError: In case page number is out of bounds
@@ -206,27 +430,36 @@ class LVMetadataExtractor:
         Returns:
             dict: containing the header_page data
         """
-        with pdfplumber.open(self.pdf_path) as pdf:
+        pdf, owns = self._open_pdf(pdf)
+        try:
             if 1 <= page_number <= len(pdf.pages):
                 page = pdf.pages[page_number - 1]
                 header_page = self.extract_header_metadata(page)
                 return header_page
             else:
                 raise IndexError(f"Page number {page_number} out of range (1–{len(pdf.pages)})")
+        finally:
+            if owns:
+                pdf.close()
 
-    def extract_first_page_metadata(self) -> dict:
+    def extract_first_page_metadata(self, pdf=None) -> dict:
         """function to extract the first pages metadata.
 
+        Args:
+            pdf: optional already-open pdfplumber PDF to reuse
+
         Returns:
             dict: returns a dictionary containing the metadata from the first page
         """
         meta = {key: "" for key in self.patterns.keys()}
 
-        with pdfplumber.open(self.pdf_path) as pdf:
+        pdf, owns = self._open_pdf(pdf)
+        try:
             page = pdf.pages[0]
-            text = page.extract_text()
+            text = self._page_text(page)
             lines = text.split("\n")
 
+            skip = set()
             angebot_match = self.patterns["Angebotsabgabe"].search(text)
             if angebot_match:
                 angebot_value = angebot_match.group(1).strip()
@@ -235,51 +468,93 @@ class LVMetadataExtractor:
                 )
                 meta["Angebotsabgabe"] = angebot_value
 
-                text = text[:angebot_match.start()] + text[angebot_match.end():]
-                lines = text.split("\n")
+                # Mark the matched lines to be skipped in the loop below
+                # instead of reallocating the page text and re-splitting it
+                offset = 0
+                for i, raw_line in enumerate(lines):
+                    if angebot_match.start() <= offset < angebot_match.end():
+                        skip.add(i)
+                    offset += len(raw_line) + 1
 
+            remaining = set(_FIELD_LABEL_TO_KEY.values())
             current_key = None
-            for line in lines:
+            for i, line in enumerate(lines):
+                if i in skip:
+                    continue
                 line = line.strip()
-                matched = False
-
-                for key, pattern in self.patterns.items():
-                    if key == "Angebotsabgabe":
-                        continue
-
-                    match = pattern.match(line)
-                    if match:
-                        value = match.group(1).strip()
-                        if key == "LV":
-                            lv_match = re.match(r"^(.*?)\s+Seite:", value)
-                            if lv_match:
-                                value = lv_match.group(1).strip()
-
-                        meta[key] = value
-                        current_key = key
-                        matched = True
-                        break
 
-                if not matched and current_key in self.MULTILINE_FIELDS:
-                    if line and not any(pat.match(line) for pat in self.patterns.values()):
-                        meta[current_key] += " " + line
+                # Labelled lines always contain a ':' - cheap containment
+                # check before invoking the regex at all
+                match = _FIELD_PREFIX_RE.match(line) if ":" in line else None
+                if match:
+                    key = _FIELD_LABEL_TO_KEY[match.group(1)]
+                    value = match.group("value").strip()
+                    if key == "LV":
+                        lv_match = _LV_SEITE_RE.match(value)
+                        if lv_match:
+                            value = lv_match.group(1).strip()
+
+                    meta[key] = value
+                    current_key = key
+                    remaining.discard(key)
+                    # Each field appears at most once; stop once all are
+                    # filled and no multiline field is still being continued
+                    if not remaining and current_key not in self.MULTILINE_FIELDS:
+                        break
+                elif line and current_key in self.MULTILINE_FIELDS:
+                    meta[current_key] += " " + line
+        finally:
+            if owns:
+                pdf.close()
 
         self.first_page_meta = meta
         return meta
-    
-    def extract_all_headers(self) -> list:
+
+    def extract_all_headers(self, pdf=None, max_workers: int = None) -> list:
         """Extract header info from every page of the pdf.
 
+        Pages are independent of each other, so multi-page PDFs are
+        dispatched to a process pool (pdfminer's parsing is Python-bound,
+        which makes threads ineffective). Falls back to the sequential
+        loop when pooling is unavailable.
+
+        Args:
+            pdf: optional already-open pdfplumber PDF to reuse
+            max_workers (int): worker processes to use (defaults to the CPU count)
+
         Returns:
             list: list containing all header information of each page
         """
         headers = []
-        with pdfplumber.open(self.pdf_path) as pdf:
+        pdf, owns = self._open_pdf(pdf)
+        try:
+            num_pages = len(pdf.pages)
+            workers = max_workers or os.cpu_count() or 1
+            if num_pages > 1 and workers > 1:
+                try:
+                    with ProcessPoolExecutor(max_workers=min(workers, num_pages)) as pool:
+                        futures = [
+                            pool.submit(_extract_header_for_page, self.pdf_path, i)
+                            for i in range(num_pages)
+                        ]
+                        results = sorted(f.result() for f in futures)
+                    for i, data in results:
+                        if data:
+                            data["Page"] = i + 1
+                            headers.append(data)
+                    self.header_meta = headers
+                    return headers
+                except Exception as e:
+                    print(f"Parallel header extraction failed, falling back to sequential: {e}")
+                    headers = []
             for page in pdf.pages:
                 data = self.extract_header_metadata(page)
                 if data:
                     data["Page"] = page.page_number
                     headers.append(data)
+        finally:
+            if owns:
+                pdf.close()
         self.header_meta = headers
         return headers
 
@@ -293,19 +568,40 @@ class LVMetadataExtractor:
         self.headers_first_meta = headers
         return headers
 
-    def extract_text_from_pdf(self, file_path: str) -> str:
+    def extract_text_from_pdf(self, file_path: str, pdf=None) -> str:
         """Extracts and concatenates text from all pages of the PDF.
 
         Args:
             file_path (str): file path
+            pdf: optional already-open pdfplumber PDF to reuse
+                (only used when file_path is the extractor's own pdf)
 
         Returns:
             str: concatenated string from all pages
         """
-        with pdfplumber.open(file_path) as pdf:
-            all_text = " ".join((page.extract_text() or "") for page in pdf.pages)
-        # Normalize whitespace for easier regex parsing
-        return " ".join(all_text.split())
+        own_file = file_path == self.pdf_path
+        if pdf is None and own_file:
+            pdf = self._pdf
+        if pdf is None and _pdfminer_extract_text is not None:
+            # No parsed handle to reuse - take the pure-text fast path
+            # instead of building pdfplumber page objects
+            return _WS_RE.sub(" ", _pdfminer_extract_text(file_path)).strip()
+        owns = pdf is None
+        if owns:
+            pdf = pdfplumber.open(file_path)
+        try:
+            # Normalize whitespace page by page (for easier regex parsing)
+            # instead of joining and re-splitting the whole document
+            if own_file:
+                parts = (_WS_RE.sub(" ", self._page_text(page)).strip() for page in pdf.pages)
+            else:
+                parts = (
+                    _WS_RE.sub(" ", page.extract_text() or "").strip() for page in pdf.pages
+                )
+            return " ".join(p for p in parts if p)
+        finally:
+            if owns:
+                pdf.close()
     
     def clean_section_post_header(self, section_text: str, header_text: str) -> str:
         """
@@ -324,18 +620,9 @@ class LVMetadataExtractor:
         if not section_text:
             return ""
         
-        cleaned_text = section_text
-
-        # Remove the full header text
-        if header_text:
-            cleaned_text = re.sub(re.escape(header_text), "", cleaned_text, flags=re.IGNORECASE)
-
-        # Remove 'Seite ' followed by digits
-        cleaned_text = re.sub(r"Seite:\s*\d+", "", cleaned_text, flags=re.IGNORECASE)
-
-        # Remove the table header line
-        table_header_pattern = r"Position\s+Menge/Einheit\s+EP\s*\([A-Z]{3}\)\s+GP\s*\([A-Z]{3}\)"
-        cleaned_text = re.sub(table_header_pattern, "", cleaned_text, flags=re.IGNORECASE)
+        # Remove the header text, the 'Seite' markers and the table header
+        # line in one pass over the section instead of three
+        cleaned_text = _post_header_clean_pattern(header_text or "").sub("", section_text)
 
         # Normalize whitespace
         cleaned_text = " ".join(cleaned_text.split())
@@ -350,20 +637,141 @@ class LVMetadataExtractor:
         Returns:
             dict: containing the Vorbemerkung and Schlussbestimmung keyed by its names
         """
-        full_text = self.extract_text_from_pdf(file_path)
+        front_text, back_text = self._collect_section_texts(file_path)
 
-        self.vorbemerkung = self.extract_section_between_text(
-            full_text, "Vorbemerkungen :", "AUSSCHREIBUNG"
+        # Locate each chunk's section delimiters in a single scan, then slice
+        positions = self._find_marker_positions(
+            front_text, ("Vorbemerkungen", "AUSSCHREIBUNG")
+        )
+        self.vorbemerkung = self._slice_section(
+            front_text, positions, "Vorbemerkungen", "AUSSCHREIBUNG"
         )
         self.vorbemerkung = self.clean_section_post_header(self.vorbemerkung, self.headers_first_meta['total_header_data'])
-        self.schlussbestimmung = self.extract_section_between_text(
-            full_text, "Schlussbemerkungen", "Ort, Datum"
+        positions = self._find_marker_positions(
+            back_text, ("Schlussbemerkungen", "Ort, Datum")
+        )
+        self.schlussbestimmung = self._slice_section(
+            back_text, positions, "Schlussbemerkungen", "Ort, Datum"
         )
         self.schlussbestimmung = self.clean_section_post_header(self.schlussbestimmung, self.headers_first_meta['total_header_data'])
         return {
             "Vorbemerkung": self.vorbemerkung,
             "Schlussbestimmung": self.schlussbestimmung,
         }
+
+    def _collect_section_texts(self, file_path: str) -> tuple:
+        """Extract only the pages needed for the two sections.
+
+        The Vorbemerkung lives in the front matter (everything up to
+        AUSSCHREIBUNG) and the Schlussbestimmung in the end matter, so the
+        pages in between never have to be text-extracted at all.
+
+        Args:
+            file_path (str): path to pdf file
+
+        Returns:
+            tuple: (front matter text, end matter text), whitespace-normalized
+        """
+        own_file = file_path == self.pdf_path
+        pdf = self._pdf if own_file else None
+        owns = pdf is None
+        if owns:
+            pdf = pdfplumber.open(file_path)
+        try:
+            pages = pdf.pages
+
+            def page_text(page):
+                raw = self._page_text(page) if own_file else (page.extract_text() or "")
+                return _WS_RE.sub(" ", raw).strip()
+
+            # The stop checks honor word boundaries like the delimiter
+            # search itself - a page mentioning 'Ausschreibungsunterlagen'
+            # must not end the scan before the real heading page
+            front_parts = []
+            for page in pages:
+                part = page_text(page)
+                if part:
+                    front_parts.append(part)
+                if _find_word(part.lower(), "ausschreibung") >= 0:
+                    break
+
+            back_parts = []
+            for page in reversed(pages):
+                part = page_text(page)
+                if part:
+                    back_parts.append(part)
+                if _find_word(part.lower(), "schlussbemerkungen") >= 0:
+                    break
+            back_parts.reverse()
+
+            return " ".join(front_parts), " ".join(back_parts)
+        finally:
+            if owns:
+                pdf.close()
+
+    def _find_marker_positions(self, text: str, keywords: tuple) -> dict:
+        """Find the first (case-insensitive) occurrence of each keyword.
+
+        Uses an Aho-Corasick automaton when pyahocorasick is installed so
+        all keywords are located in one linear pass; otherwise falls back
+        to one str.find per keyword on a shared lowercased copy.
+
+        Args:
+            text (str): text to scan
+            keywords (tuple): literal keywords to locate
+
+        Returns:
+            dict: keyword -> start offset (missing keywords are absent)
+        """
+        lower = text.lower()
+        positions = {}
+        if _ahocorasick is not None:
+            automaton = _ahocorasick.Automaton()
+            for kw in keywords:
+                automaton.add_word(kw.lower(), kw)
+            automaton.make_automaton()
+            for end_idx, kw in automaton.iter(lower):
+                # Keep the old patterns' word-boundary semantics: a hit that
+                # continues into a word (e.g. 'Ausschreibungsunterlagen')
+                # is no section delimiter
+                if kw not in positions and _is_word_boundary(lower, end_idx + 1):
+                    positions[kw] = end_idx - len(kw) + 1
+                    if len(positions) == len(keywords):
+                        break
+        else:
+            for kw in keywords:
+                idx = _find_word(lower, kw.lower())
+                if idx >= 0:
+                    positions[kw] = idx
+        return positions
+
+    def _slice_section(self, text: str, positions: dict, start_kw: str, end_kw: str) -> str:
+        """Slice the text between two already-located section delimiters.
+
+        Args:
+            text (str): full document text
+            positions (dict): keyword offsets from _find_marker_positions
+            start_kw (str): start keyword
+            end_kw (str): end keyword
+
+        Returns:
+            str: text between the keywords
+        """
+        start = positions.get(start_kw)
+        end = positions.get(end_kw)
+        if start is None or end is None:
+            return ""
+        if end <= start:
+            # End marker appears before the start marker (e.g. mentioned in
+            # front matter) - fall back to the ordered keyword search
+            return self.extract_section_between_text(text, start_kw, end_kw)
+        start += len(start_kw)
+        # Skip optional whitespace and a single ':'/'-' after the keyword
+        while start < end and text[start] in " \t\r\n":
+            start += 1
+        if start < end and text[start] in ":-–":
+            start += 1
+        return text[start:end].strip()
     
     def extract_section_between_text(self, text: str, start_kw: str, end_kw: str) -> str:
         """Extracts text between two keywords within a given full-text string.
@@ -377,12 +785,25 @@ class LVMetadataExtractor:
         Returns:
             str: contains the text betweend the start and end keywords
         """
-        pattern = re.compile(
-            rf"{start_kw}\s*[:\-–]?\s*(.*?)(?={end_kw}\b)",
-            re.IGNORECASE | re.DOTALL,
-        )
-        match = pattern.search(text)
-        return match.group(1).strip() if match else ""
+        # Both keywords are literals, so two case-insensitive str.find calls
+        # plus a slice replace the lazy full-document regex scan entirely
+        lower = text.lower()
+        start = lower.find(start_kw.lower())
+        if start < 0:
+            return ""
+        start += len(start_kw)
+        n = len(text)
+        # Skip optional whitespace and a single ':'/'-' after the keyword
+        while start < n and text[start] in " \t\r\n":
+            start += 1
+        if start < n and text[start] in ":-–":
+            start += 1
+
+        # Keep the old pattern's word-boundary semantics for the end keyword
+        end = _find_word(lower, end_kw.lower(), start)
+        if end >= 0:
+            return text[start:end].strip()
+        return ""
 
     def combine_to_dict(self) -> dict:
         """Combine extracted metadata for convenience.
@@ -397,3 +818,20 @@ class LVMetadataExtractor:
             "Vorbemerkung" : self.vorbemerkung,
             "Schlussbestimmung" : self.schlussbestimmung
         }
+
+
+def _extract_header_for_page(pdf_path: str, page_index: int) -> tuple:
+    """Worker for extract_all_headers: extract a single page's header.
+
+    Runs in a separate process, so it opens only the page it needs.
+
+    Args:
+        pdf_path (str): path to the pdf file
+        page_index (int): 0-indexed page to process
+
+    Returns:
+        tuple: (page_index, header dict)
+    """
+    extractor = LVMetadataExtractor(pdf_path)
+    with pdfplumber.open(pdf_path, pages=[page_index + 1]) as pdf:
+        return page_index, extractor.extract_header_metadata(pdf.pages[0])
@@ -1,8 +1,31 @@
-import pdfplumber
-import pandas as pd
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pypdfium2 as pdfium
+
 from src.MetaDataExtractor import LVMetadataExtractor
 
+# One combined line pattern: the alternatives keep the priority order of the
+# old section/position patterns, and m.lastgroup tells which kind of line
+# matched with a single regex call per line. Quantity lines have such a
+# simple shape that _process_quantity_unit scans them by hand instead.
+_LINE_PATTERN = re.compile(
+    r"^(?:(?P<sec_num>\d+)\s+(?P<sec_name>[A-Za-zÄÖÜäöüß\s\-]+)$"
+    r"|(?P<pos_id>\d+\.\.\.\d+)\s+(?P<pos_desc>.*))"
+)
+_UEBERTRAG_RE = re.compile(
+    r"Ü+\s*b+e+r+t+r+a+g+[:]*.*?EP\s*\(EUR\)\s*GP\s*\(EUR\)",
+    re.IGNORECASE | re.DOTALL,
+)
+_WS_RE = re.compile(r"\s+")
+# str.startswith accepts a tuple and checks all prefixes in one C call
+_SKIP_PREFIXES = ("Übertrag", "Summe", "mailto:", "Projekt:")
+
+
 class PDFPositionExtractor():
     """
     Extract structured position data from a PDF containing sections, positions, quantities, and descriptions.
@@ -15,29 +38,61 @@ class PDFPositionExtractor():
 
     Attributes:
         pdf_path (str): Path to the PDF file to extract.
+        metadata_header (dict): First-page header metadata. Callers that
+            already ran LVMetadataExtractor can pass it in to avoid
+            re-parsing the PDF a second time.
     """
-    def __init__(self, pdf_path: str):
+    def __init__(self, pdf_path: str, metadata_header: dict = None):
         self.pdf_path = pdf_path
-        self.rows = []
+        # Column-wise (SoA) collection: appending per column avoids the
+        # per-row dict objects and the transpose pd.DataFrame(list_of_dicts)
+        # would otherwise do
+        self._cols = {
+            "Section": [],
+            "SectionHint": [],
+            "Position": [],
+            "MainDescription": [],
+            "DetailedDescription": [],
+            "Quantity": [],
+            "Unit": [],
+            "Page": [],
+        }
         self.section = None
         self.current = None
-        self.section_hint = ""
+        # Section hints accumulate as a list of lines and are joined once
+        # when consumed, instead of re-stripping a growing string per line
+        self._section_hint_parts = []
+        # Section, SectionHint and Unit carry only a handful of distinct
+        # values per PDF, so categorical storage shares the strings instead
+        # of keeping one object per row
         self.datatypes = {
-                            'Section': 'string',
-                            'SectionHint': 'string',
+                            'Section': 'category',
+                            'SectionHint': 'category',
                             'MainDescription': 'string',
                             'DetailedDescription': 'string',
                             'Quantity': float,
-                            'Unit': 'string',           
+                            'Unit': 'category',
                             'Page': 'int32',
                             'Position': 'string'
                         }
 
-        # Precompile regex patterns
-        self.pos_pattern = re.compile(r"^(\d+\.\.\.\d+)\s+(.*)")
-        self.qty_pattern = re.compile(r"^([\d.]+(?:,\d+)?)\s+(\S+)")
-        self.section_pattern = re.compile(r"^(\d+)\s+([A-Za-zÄÖÜäöüß\s\-]+)$")
-        self.metadata_header = LVMetadataExtractor(self.pdf_path).extract_first_header()
+        if metadata_header is None:
+            metadata_header = LVMetadataExtractor(self.pdf_path).extract_first_header()
+        self.metadata_header = metadata_header
+
+        # Compile the company-block pattern once; the company name is fixed
+        # per extractor, so _clean_detailed_description must not rebuild it
+        # per position. Both footer variants share one alternation so the
+        # description is scanned once instead of twice.
+        self._company_block_re = None
+        unternehmen = self.metadata_header.get("Unternehmen")
+        if unternehmen:
+            company_pattern = re.escape(unternehmen).replace(r"\ ", r"\s*")
+            self._company_block_re = re.compile(
+                rf"{company_pattern}.*?"
+                r"(?:EP\s*\(EUR\)\s*GP\s*\(EUR\)|Firmenstempel,\s*rechtsverbindliche\s*Unterschrift)",
+                re.IGNORECASE | re.DOTALL,
+            )
 
 
     def main(self) -> pd.DataFrame:
@@ -61,7 +116,22 @@ class PDFPositionExtractor():
         return df
     
     def fill_hint_columns(self, df:pd.DataFrame) -> pd.DataFrame:
-        df['SectionHint'] = df.groupby('position_level_1')['SectionHint'].transform(lambda x: x.ffill().bfill())
+        if len(df) == 0:
+            return df
+        # Positions arrive in document order, so the level-1 groups are
+        # contiguous blocks and the fill reduces to one vectorized pass
+        # without building a groupby index at all
+        group_ids = df['position_level_1'].to_numpy()
+        if (group_ids[1:] >= group_ids[:-1]).all():
+            values = df['SectionHint'].to_numpy(dtype=object)
+            filled = _ffill_blocks(values, group_ids)
+            filled = _ffill_blocks(filled[::-1], group_ids[::-1])[::-1]
+            df['SectionHint'] = pd.Series(filled, index=df.index).astype(df['SectionHint'].dtype)
+        else:
+            # groupby.ffill/bfill run in pandas' Cython fill kernels instead
+            # of invoking a Python lambda per group
+            df['SectionHint'] = df.groupby('position_level_1')['SectionHint'].ffill()
+            df['SectionHint'] = df.groupby('position_level_1')['SectionHint'].bfill()
         return df
         
     def generate_position_levels(self, df:pd.DataFrame, position_column:str = 'Position', postion_datatype:str='int32') -> pd.DataFrame:
@@ -73,9 +143,12 @@ class PDFPositionExtractor():
             - position_level_2: the last segment (sub-position)
         and converts them to the specified numeric datatype.
         """
-        df['position_level_1'] = df[position_column].str.split('.').str[0].astype(postion_datatype)
-        df['position_level_2'] = df[position_column].str.split('.').str[-1].astype(postion_datatype)
-        return df 
+        # One C-level regex pass yields both segments; the double str.split
+        # materialized two intermediate Series of Python lists
+        levels = df[position_column].str.extract(r'^(\d+)\.+(\d+)$')
+        df['position_level_1'] = levels[0].astype(postion_datatype)
+        df['position_level_2'] = levels[1].astype(postion_datatype)
+        return df
     
     def cleaning_steps(self, df:pd.DataFrame) -> pd.DataFrame:
         """Apply individual cleaning rules to the extracted DataFrame.
@@ -84,9 +157,17 @@ class PDFPositionExtractor():
             - Replace placeholder text with NaN
             - Clear specific strings in SectionHint values
         """
-        df.replace(['___ ________ ____________','________'], pd.NA, inplace=True)
-        replace_indices = df[df['SectionHint'].str.startswith('Ingenieurbüro Wagner und Koll')==True].index
-        df.loc[replace_indices, 'SectionHint'] = pd.NA
+        # Placeholders only ever show up in the free-text columns, so the
+        # replace is scoped to them instead of scanning the whole frame,
+        # and both SectionHint rules collapse into a single mask assignment
+        placeholders = ['___ ________ ____________', '________']
+        mask = (
+            df['SectionHint'].isin(placeholders)
+            | df['SectionHint'].str.startswith('Ingenieurbüro Wagner und Koll', na=False)
+        )
+        df.loc[mask, 'SectionHint'] = pd.NA
+        for column in ('MainDescription', 'DetailedDescription'):
+            df[column] = df[column].replace(placeholders, pd.NA)
         return df
     
     def parse_datatypes(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -101,14 +182,68 @@ class PDFPositionExtractor():
         
         # Normalize Quantity column
         if "Quantity" in df.columns:
-            df["Quantity"] = df["Quantity"].apply(self._normalize_number)
-            df["Quantity"] = pd.to_numeric(df["Quantity"], errors="coerce")
-        
-        # Apply all other datatypes defined in self.datatypes
-        df = df.astype(self.datatypes, errors="ignore")
+            df["Quantity"] = pd.to_numeric(
+                self._normalize_number_series(df["Quantity"]), errors="coerce"
+            )
         
+        # Apply all other datatypes defined in self.datatypes, converting
+        # only the columns that do not have their target dtype yet and
+        # without forcing copies of the ones that do
+        needs = {
+            col: dtype
+            for col, dtype in self.datatypes.items()
+            if col in df.columns and df[col].dtype != pd.api.types.pandas_dtype(dtype)
+        }
+        if needs:
+            df = df.astype(needs, copy=False, errors="ignore")
+
         return df
 
+    def _normalize_number_series(self, values: pd.Series) -> pd.Series:
+        """Vectorized counterpart of `_normalize_number` for a whole column.
+
+        Applies the same European-number rules (commas as decimal
+        separators, dots/spaces as thousands separators) via pandas string
+        ops instead of a Python-level apply per row.
+
+        Args:
+            values (pd.Series): raw quantity values
+
+        Returns:
+            pd.Series: normalized values as 'string' dtype (NA preserved)
+        """
+        s = values.astype("string").str.strip()
+
+        # Case 1: contains comma → last comma is decimal separator
+        comma_parts = s.str.rsplit(",", n=1, expand=True)
+        if comma_parts.shape[1] == 1:
+            comma_parts[1] = pd.NA
+        has_comma = comma_parts[1].notna()
+        comma_value = (
+            comma_parts[0].str.replace(".", "", regex=False).str.replace(" ", "", regex=False)
+            + "."
+            + comma_parts[1]
+        )
+
+        # Case 2: no comma → a last dot with ≤ 2 trailing digits is the
+        # decimal separator, otherwise all dots are thousands separators
+        dot_parts = s.str.rsplit(".", n=1, expand=True)
+        if dot_parts.shape[1] == 1:
+            dot_parts[1] = pd.NA
+        has_dot = ~has_comma & dot_parts[1].notna()
+        dot_is_decimal = (has_dot & dot_parts[1].str.len().le(2)).fillna(False)
+        dot_value = (
+            dot_parts[0].str.replace(".", "", regex=False).str.replace(" ", "", regex=False)
+            + "."
+            + dot_parts[1]
+        )
+        thousands_value = s.str.replace(".", "", regex=False).str.replace(" ", "", regex=False)
+
+        result = s.mask(has_comma, comma_value)
+        result = result.mask(dot_is_decimal, dot_value)
+        result = result.mask((has_dot & ~dot_is_decimal).fillna(False), thousands_value)
+        return result
+
     def extract(self) -> pd.DataFrame:
         """Extract structured position data from a PDF into a Pandas DataFrame.
 
@@ -137,22 +272,53 @@ class PDFPositionExtractor():
                 - Unit: str, the unit of the quantity
                 - Page: int, the page number in the PDF where the position appears
         """
-        with pdfplumber.open(self.pdf_path) as pdf:
-            num_pages = len(pdf.pages)
-            for i, page in enumerate(pdf.pages, start=1):
-                text = page.extract_text()
-                if not text:
-                    continue
-                lines = text.split('\n')
-                # Mark last page correctly
-                is_last = i == num_pages
-                self._process_lines(lines, page.page_number, is_last_page=is_last)
-        
-        # Convert collected rows into DataFrame
-        df = pd.DataFrame(self.rows)
+        page_texts = self._extract_page_texts()
+        num_pages = len(page_texts)
+        for i, text in enumerate(page_texts, start=1):
+            if not text:
+                continue
+            # Mark last page correctly
+            is_last = i == num_pages
+            self._process_lines(_iter_lines(text), i, is_last_page=is_last)
+
+        # Build the DataFrame directly from the collected columns
+        df = pd.DataFrame(self._cols)
         return df
+
+    def _extract_page_texts(self, max_workers: int = None) -> list[str]:
+        """Extract the raw text of every page, in page order.
+
+        Text extraction is independent per page and dominates extraction
+        time, so multi-page PDFs fan out to a process pool (PDF parsing is
+        Python-bound, which makes threads ineffective). The stateful line
+        processing stays sequential in the parent so section and position
+        continuation across pages is preserved.
+
+        Args:
+            max_workers (int): worker processes to use (defaults to the CPU count)
+
+        Returns:
+            list[str]: one text string per page (empty string for empty pages)
+        """
+        doc = pdfium.PdfDocument(self.pdf_path)
+        try:
+            num_pages = len(doc)
+            workers = max_workers or os.cpu_count() or 1
+            if num_pages > 1 and workers > 1:
+                try:
+                    with ProcessPoolExecutor(max_workers=min(workers, num_pages)) as pool:
+                        futures = [
+                            pool.submit(_extract_page_text, self.pdf_path, i)
+                            for i in range(num_pages)
+                        ]
+                        return [text for _, text in sorted(f.result() for f in futures)]
+                except Exception as e:
+                    print(f"Parallel page extraction failed, falling back to sequential: {e}")
+            return [_page_text(doc, i) for i in range(num_pages)]
+        finally:
+            doc.close()
     
-    def _process_lines(self, lines: list[str], page_number: int, is_last_page: bool = False) -> None:
+    def _process_lines(self, lines, page_number: int, is_last_page: bool = False) -> None:
         """Process each line of a PDF page to extract structured position data.
 
         This function iterates through all lines on a page and delegates processing to specialized helper methods:
@@ -165,99 +331,122 @@ class PDFPositionExtractor():
         At the end of the page (or for the last page), it finalizes any currently open position and appends it to the collected rows.
 
         Args:
-            lines (list[str]): List of strings representing lines extracted from a PDF page.
+            lines: Iterable of stripped, non-empty lines extracted from a PDF page.
             page_number (int): The current page number being processed.
             is_last_page (bool, optional): If True, ensures the last open position is finalized.
                                             Defaults to False.
 
         Returns:
-            None: The function updates self.rows and self.current in place.
+            None: The function updates self._cols and self.current in place.
         """
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+        # Bind the handlers once - the per-line attribute lookups are pure
+        # interpreter overhead on this hot path
+        match_line = _LINE_PATTERN.match
+        process_section_header = self._process_section_header
+        process_position = self._process_position
+        process_quantity_unit = self._process_quantity_unit
+        process_section_hint = self._process_section_hint
+        process_detailed_description = self._process_detailed_description
 
-            # Try each type of line in priority order
-            if self._process_section_header(line):
-                continue
-            if self._process_position(line, page_number):
-                continue
-            if self._process_quantity_unit(line):
-                continue
-            if self._process_section_hint(line):
+        for line in lines:
+            # All three structured line kinds start with a digit - most
+            # lines are description text, so this one-character check spares
+            # them any further classification. The regex keeps the old
+            # priority order (section, position); quantity lines are simple
+            # enough to scan by hand afterwards.
+            if line[0].isdigit():
+                match = match_line(line)
+                if match is not None:
+                    if match.lastgroup == "sec_name":
+                        process_section_header(match)
+                    else:
+                        process_position(match, page_number)
+                    continue
+                if process_quantity_unit(line):
+                    continue
+            if process_section_hint(line):
                 continue
-            self._process_detailed_description(line)
+            process_detailed_description(line)
 
         # Save the last position at the end of the page
         if is_last_page:
             self._finalize_current_position()
 
 
-    def _process_section_header(self, line: str) -> bool:
-        """Detect and process a section header line.
+    def _process_section_header(self, sec_match: re.Match) -> None:
+        """Process a matched section header line.
 
-        If a section header is detected, finalizes any open position, updates the current section, and clears section hints.
+        Finalizes any open position, updates the current section, and clears section hints.
 
         Args:
-            line (str): A single line of text from the PDF.
-
-        Returns:
-            bool: True if the line was a section header and processed, else False.
+            sec_match (re.Match): line match with the 'sec_name' group set.
         """
-        sec_match = self.section_pattern.match(line)
-        if not sec_match:
-            return False
         self._finalize_current_position()
-        self.section = sec_match.group(2).strip()
-        self.section_hint = ""
-        return True
+        # Interned so the many position rows of a section share one string
+        # object instead of each holding its own copy
+        self.section = sys.intern(sec_match.group("sec_name").strip())
+        self._section_hint_parts.clear()
 
-    def _process_position(self, line: str, page_number: int) -> bool:
-        """Detect and process a new position line.
+    def _process_position(self, pos_match: re.Match, page_number: int) -> None:
+        """Process a matched new position line.
 
         Finalizes any open position, creates a new current position dictionary with default fields, and clears section hints.
 
         Args:
-            line (str): A single line of text from the PDF.
+            pos_match (re.Match): line match with the 'pos_id'/'pos_desc' groups set.
             page_number (int): The current page number being processed.
-
-        Returns:
-            bool: True if the line represents a new position, else False.
         """
-        pos_match = self.pos_pattern.match(line)
-        if not pos_match:
-            return False
         self._finalize_current_position()
         self.current = {
             "Section": self.section,
-            "SectionHint": self.section_hint.strip() if self.section_hint else None,
-            "Position": pos_match.group(1),
-            "MainDescription": pos_match.group(2).strip(),
-            "DetailedDescription": "",
+            "SectionHint": " ".join(self._section_hint_parts) if self._section_hint_parts else None,
+            "Position": pos_match.group("pos_id"),
+            "MainDescription": pos_match.group("pos_desc").strip(),
+            # Accumulated as a list of lines and joined once at finalize -
+            # repeated '+=' on a string copies the whole buffer every line
+            "DetailedDescription": [],
             "Quantity": None,
             "Unit": None,
             "Page": page_number
         }
-        self.section_hint = ""
-        return True
+        self._section_hint_parts = []
 
     def _process_quantity_unit(self, line: str) -> bool:
-        """Detect and process a quantity/unit line for the current position.
+        """Parse and store a quantity/unit line for the current position.
 
-        If a quantity/unit line is matched, stores the raw quantity and unit in self.current.
+        Quantity lines have the fixed shape "<number> <unit>" (European
+        number, whitespace, unit token), which a character scan recognizes
+        without paying for a regex call on every digit-led line.
 
         Args:
-            line (str): A single line of text from the PDF.
+            line (str): stripped line whose first character is a digit.
 
         Returns:
-            bool: True if the line was a quantity/unit line, else False.
+            bool: True if the line was stored as quantity/unit, else False.
         """
-        qty_match = self.qty_pattern.match(line)
-        if not qty_match or not self.current:
+        if not self.current:
+            return False
+        n = len(line)
+        i = 0
+        while i < n and line[i] in "0123456789.,":
+            i += 1
+        if i == n:
             return False
-        self.current["Quantity"] = qty_match.group(1)
-        self.current["Unit"] = qty_match.group(2)
+        qty = line[:i]
+        # The number is digits/dots with at most one ',<digits>' decimal tail
+        head, sep, tail = qty.partition(",")
+        if sep and not tail.isdigit():
+            return False
+        j = i
+        while j < n and line[j].isspace():
+            j += 1
+        if j == i or j == n:
+            return False
+        k = j
+        while k < n and not line[k].isspace():
+            k += 1
+        self.current["Quantity"] = qty
+        self.current["Unit"] = line[j:k]
         return True
 
     def _process_section_hint(self, line:str) -> bool:
@@ -270,7 +459,7 @@ class PDFPositionExtractor():
             bool: True if the line was treated as a section hint, else False.
         """
         if self.section and not self.current:
-            self.section_hint = (self.section_hint + " " + line).strip() if self.section_hint else line
+            self._section_hint_parts.append(line)
             return True
         return False
 
@@ -283,19 +472,15 @@ class PDFPositionExtractor():
         Args:
             line (str): string containing the content within a line
         """
-        skip_tokens = ["Übertrag", "Summe", "mailto:", "Projekt:"]
         if not self.current:
             return
 
-        # If the line is entirely one of the skip tokens, skip it
-        if any(line.startswith(tok) for tok in skip_tokens):
+        # Skip lines starting with one of the known irrelevant tokens
+        if line.startswith(_SKIP_PREFIXES):
             return
 
         # Append the line (preserve content; we'll clean later)
-        if self.current["DetailedDescription"]:
-            self.current["DetailedDescription"] += " " + line
-        else:
-            self.current["DetailedDescription"] = line
+        self.current["DetailedDescription"].append(line)
 
     def _clean_detailed_description(self, desc: str) -> str:
         """Remove 'Übertrag', company blocks ending with EP/GP footer, and company → ZUSAMMENFASSUNG."""
@@ -305,45 +490,28 @@ class PDFPositionExtractor():
         s = desc
 
         # Remove Übertrag block as before
-        s = re.sub(
-            r"Ü+\s*b+e+r+t+r+a+g+[:]*.*?EP\s*\(EUR\)\s*GP\s*\(EUR\)",
-            " ",
-            s,
-            flags=re.IGNORECASE | re.DOTALL,
-        )
+        s = _UEBERTRAG_RE.sub(" ", s)
 
-        # Remove block starting with 'Unternehmen' from metadata, ending with EP/GP footer
-        if hasattr(self, "metadata_header"):
-            unternehmen = self.metadata_header.get("Unternehmen")
-            if unternehmen:
-                company_pattern = re.escape(unternehmen)
-                company_pattern = company_pattern.replace(r"\ ", r"\s*")
-                pattern = rf"{company_pattern}.*?EP\s*\(EUR\)\s*GP\s*\(EUR\)"
-                s = re.sub(pattern, " ", s, flags=re.IGNORECASE | re.DOTALL)
-
-        # Remove block starting with 'Unternehmen Name' and ending with ZUSAMMENFASSUNG
-        if hasattr(self, "metadata_header"):
-            unternehmen = self.metadata_header.get("Unternehmen")
-            if unternehmen:
-                company_pattern = re.escape(unternehmen)
-                company_pattern = company_pattern.replace(r"\ ", r"\s*")
-                pattern = rf"{company_pattern}.*?Firmenstempel, rechtsverbindliche Unterschrift"
-                s = re.sub(pattern, " ", s, flags=re.IGNORECASE | re.DOTALL)
+        # Remove blocks starting with 'Unternehmen' from metadata, ending
+        # with either the EP/GP footer or the signature footer
+        if self._company_block_re is not None:
+            s = self._company_block_re.sub(" ", s)
 
         # Cleanup leftover whitespace
-        s = re.sub(r"\s+", " ", s).strip()
+        s = _WS_RE.sub(" ", s).strip()
 
         return s
 
     def _finalize_current_position(self):
         if self.current:
-            if self.current.get("DetailedDescription"):
-                self.current["DetailedDescription"] = self._clean_detailed_description(
-                    self.current["DetailedDescription"]
-                )
-                if not self.current["DetailedDescription"]:
-                    self.current["DetailedDescription"] = None
-            self.rows.append(self.current)
+            desc = " ".join(self.current["DetailedDescription"])
+            if desc:
+                desc = self._clean_detailed_description(desc)
+                if not desc:
+                    desc = None
+            self.current["DetailedDescription"] = desc
+            for key, values in self._cols.items():
+                values.append(self.current[key])
             self.current = None
 
 
@@ -375,11 +543,18 @@ class PDFPositionExtractor():
                 - No thousands separators
                 - Suitable for conversion to float
         """
-        if pd.isna(value):
+        # Strings are the common case; testing them first skips the dtype
+        # dispatch pd.isna would do on every row
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                return value
+        elif value is None or value is pd.NA or value != value:
+            # identity checks plus the NaN self-inequality trick cover the
+            # missing values without pandas' per-value isna dispatch
             return value
-        if not isinstance(value, str):
-            value = str(value)
-        value = value.strip()
+        else:
+            value = str(value).strip()
 
         # Case 1: contains comma → last comma is decimal separator
         if ',' in value:
@@ -400,3 +575,85 @@ class PDFPositionExtractor():
         return value
 
 
+def _iter_lines(text: str):
+    """Yield the stripped, non-empty lines of a page text.
+
+    Pre-filters lines lazily so the state machine never sees blanks and no
+    intermediate line list is materialized.
+
+    Args:
+        text (str): raw page text
+
+    Yields:
+        str: stripped line
+    """
+    for raw in text.splitlines():
+        line = raw.strip()
+        if line:
+            yield line
+
+
+def _ffill_blocks(values: np.ndarray, group_ids: np.ndarray) -> np.ndarray:
+    """Forward-fill an object array within contiguous group blocks.
+
+    Equivalent to a groupby-ffill when the group ids form contiguous runs,
+    but implemented with two cumulative-maximum passes instead of a group
+    index.
+
+    Args:
+        values (np.ndarray): object array with pd.NA/NaN gaps
+        group_ids (np.ndarray): block id per row (contiguous runs)
+
+    Returns:
+        np.ndarray: forward-filled copy of values
+    """
+    n = len(values)
+    positions = np.arange(n)
+    new_block = np.empty(n, dtype=bool)
+    new_block[0] = True
+    new_block[1:] = group_ids[1:] != group_ids[:-1]
+    block_start = np.maximum.accumulate(np.where(new_block, positions, 0))
+
+    last_valid = np.maximum.accumulate(np.where(~pd.isna(values), positions, -1))
+    # Only take a carried value if it originates from the same block
+    return np.where(last_valid >= block_start, values[last_valid], values)
+
+
+def _page_text(doc, page_index: int) -> str:
+    """Extract the text of a single page from an open pdfium document.
+
+    Args:
+        doc: open pypdfium2.PdfDocument
+        page_index (int): 0-indexed page to extract
+
+    Returns:
+        str: page text (with '\\n' line breaks)
+    """
+    page = doc[page_index]
+    textpage = page.get_textpage()
+    try:
+        return textpage.get_text_range().replace("\r\n", "\n").replace("\r", "\n")
+    finally:
+        textpage.close()
+        page.close()
+
+
+def _extract_page_text(pdf_path: str, page_index: int) -> tuple:
+    """Worker for _extract_page_texts: pull a single page's text.
+
+    Runs in a separate process with its own document handle.
+
+    Args:
+        pdf_path (str): path to the pdf file
+        page_index (int): 0-indexed page to process
+
+    Returns:
+        tuple: (page_index, page text)
+    """
+    doc = pdfium.PdfDocument(pdf_path)
+    try:
+        return page_index, _page_text(doc, page_index)
+    finally:
+        doc.close()
+
+